@@ -1,7 +1,8 @@
 import os
 import logging
-from fuzzywuzzy import fuzz
-from sklearn.metrics import precision_score, recall_score
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 
 
 logging.basicConfig(
@@ -21,13 +22,15 @@ def load_terms_and_map(directory):
               a list of terms and a dictionary mapping terms to their sections.
     """
     terms_map = {}
-    for filename in os.listdir(directory):
-        if filename.endswith("_terms.txt"):
-            with open(os.path.join(directory, filename), "r", encoding="utf-8") as file:
-                content = file.read()
-                terms, term_section_map = parse_term_extraction_results(content)
-                terms_map[filename] = (terms, term_section_map)
-                logging.info(f"Loaded terms from {filename}")
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith("_terms.txt") and entry.is_file():
+                with open(entry.path, "r", encoding="utf-8") as file:
+                    # Lowercase once here instead of per line in the parser.
+                    content = file.read().lower()
+                    terms, term_section_map = parse_term_extraction_results(content)
+                    terms_map[entry.name] = (terms, term_section_map)
+                    logging.info("Loaded terms from %s", entry.name)
     return terms_map
 
 
@@ -36,7 +39,8 @@ def parse_term_extraction_results(content):
     Parse the term extraction results from file content.
 
     Args:
-        content (str): Content of the term extraction results file.
+        content (str): Content of the term extraction results file,
+                       already lowercased by the caller.
 
     Returns:
         tuple: A tuple containing a list of terms and a dictionary mapping terms to their sections.
@@ -48,19 +52,15 @@ def parse_term_extraction_results(content):
 
     for line in lines:
         if line.startswith("- "):
-            term = line[2:].strip().lower()  # Convert to lowercase for consistency
+            term = line[2:].strip()
             terms.append(term)
             term_section_map[term] = []
             current_term = term
-        elif line.startswith("Term:"):
-            current_term = (
-                line.split(":")[1].strip().lower()
-            )  # Convert to lowercase for consistency
-        elif line.startswith("Section:"):
+        elif line.startswith("term:"):
+            current_term = line.split(":")[1].strip()
+        elif line.startswith("section:"):
             if current_term:
-                term_section_map[current_term].append(
-                    line[9:].strip().lower()
-                )  # Convert to lowercase for consistency
+                term_section_map[current_term].append(line[9:].strip())
 
     return terms, term_section_map
 
@@ -76,23 +76,33 @@ def evaluate_precision_recall(ground_truth_terms, extracted_terms):
     Returns:
         tuple: A tuple containing precision and recall scores.
     """
-    all_terms = list(set(ground_truth_terms + extracted_terms))
-    y_true = [term in ground_truth_terms for term in all_terms]
-    y_pred = [term in extracted_terms for term in all_terms]
-
-    logging.info(f"Ground Truth Terms: {ground_truth_terms}")
-    logging.info(f"Extracted Terms: {extracted_terms}")
-
-    true_positives = sum(y_true[i] and y_pred[i] for i in range(len(y_true)))
-    false_positives = sum(y_pred[i] and not y_true[i] for i in range(len(y_true)))
-    false_negatives = sum(y_true[i] and not y_pred[i] for i in range(len(y_true)))
-
-    logging.info(f"True Positives: {true_positives}")
-    logging.info(f"False Positives: {false_positives}")
-    logging.info(f"False Negatives: {false_negatives}")
-
-    precision = precision_score(y_true, y_pred, zero_division=1)
-    recall = recall_score(y_true, y_pred, zero_division=1)
+    ground_truth_set = set(ground_truth_terms)
+    extracted_set = set(extracted_terms)
+
+    logging.debug("Ground Truth Terms: %s", ground_truth_terms)
+    logging.debug("Extracted Terms: %s", extracted_terms)
+
+    true_positives = len(ground_truth_set & extracted_set)
+    false_positives = len(extracted_set - ground_truth_set)
+    false_negatives = len(ground_truth_set - extracted_set)
+
+    logging.info(
+        "True Positives: %d, False Positives: %d, False Negatives: %d",
+        true_positives,
+        false_positives,
+        false_negatives,
+    )
+
+    precision = (
+        true_positives / (true_positives + false_positives)
+        if true_positives + false_positives > 0
+        else 1.0
+    )
+    recall = (
+        true_positives / (true_positives + false_negatives)
+        if true_positives + false_negatives > 0
+        else 1.0
+    )
 
     return precision, recall
 
@@ -111,38 +121,66 @@ def evaluate_mapping_efficiency(ground_truth_map, extracted_map):
     correct_mappings = 0
     total_mappings = 0
 
+    # Normalize every ground truth section once up front so the scorers
+    # don't re-run the same preprocessing for each extracted section.
+    gt_processed = {
+        term: [default_process(section) for section in sections]
+        for term, sections in ground_truth_map.items()
+    }
+
     for term, sections in extracted_map.items():
         if term in ground_truth_map:
-            for extracted_section in sections:
-                best_similarity = 0
-                for ground_truth_section in ground_truth_map[term]:
-                    ratio_similarity = fuzz.ratio(
-                        extracted_section, ground_truth_section
-                    )
-                    partial_similarity = fuzz.partial_ratio(
-                        extracted_section, ground_truth_section
-                    )
-                    token_set_similarity = fuzz.token_set_ratio(
-                        extracted_section, ground_truth_section
-                    )
-                    similarity = max(
-                        ratio_similarity, partial_similarity, token_set_similarity
-                    )
-                    best_similarity = max(best_similarity, similarity)
-
-                if best_similarity > 75:  # Lowered threshold for better matching
-                    correct_mappings += 1
-                total_mappings += 1
-
-            logging.info(f"Term: {term}")
-            logging.info(f"Extracted Sections: {sections}")
-            logging.info(f"Ground Truth Sections: {ground_truth_map[term]}")
+            ground_truth_sections = gt_processed[term]
+            total_mappings += len(sections)
+
+            if sections and ground_truth_sections:
+                processed_sections = [default_process(section) for section in sections]
+                # Batch all section pairs into one C-level call per scorer
+                # instead of looping over pairs in Python. Keep the explicit
+                # max over the three scorers: WRatio is not a substitute
+                # here, since it down-weights partial/token matches between
+                # the paragraph-length extracted sections and the one-line
+                # ground truth sections, dropping pairs below the threshold.
+                ratio_matrix = process.cdist(
+                    processed_sections,
+                    ground_truth_sections,
+                    scorer=fuzz.ratio,
+                    processor=None,
+                    score_cutoff=75,
+                    workers=-1,
+                )
+                partial_matrix = process.cdist(
+                    processed_sections,
+                    ground_truth_sections,
+                    scorer=fuzz.partial_ratio,
+                    processor=None,
+                    score_cutoff=75,
+                    workers=-1,
+                )
+                token_set_matrix = process.cdist(
+                    processed_sections,
+                    ground_truth_sections,
+                    scorer=fuzz.token_set_ratio,
+                    processor=None,
+                    score_cutoff=75,
+                    workers=-1,
+                )
+                best_similarities = np.maximum.reduce(
+                    [ratio_matrix, partial_matrix, token_set_matrix]
+                ).max(axis=1)
+                correct_mappings += int(
+                    (best_similarities > 75).sum()
+                )  # Lowered threshold for better matching
+
+            logging.debug("Term: %s", term)
+            logging.debug("Extracted Sections: %s", sections)
+            logging.debug("Ground Truth Sections: %s", ground_truth_map[term])
 
     mapping_efficiency = correct_mappings / total_mappings if total_mappings > 0 else 0
 
-    logging.info(f"Correct Mappings: {correct_mappings}")
-    logging.info(f"Total Mappings: {total_mappings}")
-    logging.info(f"Mapping Efficiency: {mapping_efficiency:.4f}")
+    logging.info("Correct Mappings: %d", correct_mappings)
+    logging.info("Total Mappings: %d", total_mappings)
+    logging.info("Mapping Efficiency: %.4f", mapping_efficiency)
 
     return mapping_efficiency
 
@@ -172,10 +210,10 @@ def main():
                 ground_truth_map, extracted_map
             )
 
-            logging.info(f"Evaluation for {filename}:")
-            logging.info(f"Precision: {precision:.4f}")
-            logging.info(f"Recall: {recall:.4f}")
-            logging.info(f"Mapping Efficiency: {mapping_efficiency:.4f}")
+            logging.info("Evaluation for %s:", filename)
+            logging.info("Precision: %.4f", precision)
+            logging.info("Recall: %.4f", recall)
+            logging.info("Mapping Efficiency: %.4f", mapping_efficiency)
             logging.info("\n---\n")
 
 
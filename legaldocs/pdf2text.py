@@ -1,15 +1,48 @@
 import os
 import logging
+from functools import partial
+from multiprocessing import Pool
+
 import fitz  # PyMuPDF
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+def _extract_one(pdf_path, text_directory):
+    """
+    Extract text from a single PDF file and save it as a text file.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+        text_directory (str): The directory to save the extracted text file.
+    """
+    filename = os.path.basename(pdf_path)
+    text_path = os.path.join(text_directory, filename.replace(".pdf", "_text.txt"))
+
+    try:
+        logging.info(f"Extracting text from {pdf_path}")
+        # Open inside the worker: fitz documents are not fork-safe, so each
+        # process must own its own handle.
+        doc = fitz.open(pdf_path, filetype="pdf")
+        # Stream each page straight to the output file rather than growing
+        # one string per page, which is quadratic in document length.
+        with open(text_path, "w", encoding="utf-8") as text_file:
+            for page in doc:
+                text_file.write(page.get_text())
+                text_file.write("\n")
+        doc.close()
+        logging.info(f"Saved extracted text to {text_path}")
+    except Exception as e:
+        logging.error(f"Error extracting text from {pdf_path}: {e}")
+
 def extract_text_from_pdf(pdf_directory, text_directory):
     """
     Extract text from all PDF files in the specified directory and save them as text files.
 
+    PDF parsing is CPU-bound, so files are split across a process pool and
+    handled in parallel.
+
     Args:
         pdf_directory (str): The directory containing PDF files.
         text_directory (str): The directory to save the extracted text files.
@@ -21,21 +54,14 @@ def extract_text_from_pdf(pdf_directory, text_directory):
     if not os.path.exists(text_directory):
         os.makedirs(text_directory)
 
-    for filename in os.listdir(pdf_directory):
-        if filename.endswith(".pdf"):
-            pdf_path = os.path.join(pdf_directory, filename)
-            text_path = os.path.join(text_directory, filename.replace(".pdf", "_text.txt"))
-
-            try:
-                logging.info(f"Extracting text from {pdf_path}")
-                doc = fitz.open(pdf_path)
-                text = ""
-                for page in doc:
-                    text += page.get_text() + "\n"
-                doc.close()
-
-                with open(text_path, "w", encoding="utf-8") as text_file:
-                    text_file.write(text)
-                logging.info(f"Saved extracted text to {text_path}")
-            except Exception as e:
-                logging.error(f"Error extracting text from {pdf_path}: {e}")
+    with os.scandir(pdf_directory) as entries:
+        pdf_paths = [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".pdf") and entry.is_file()
+        ]
+    if not pdf_paths:
+        return
+
+    with Pool() as pool:
+        pool.map(partial(_extract_one, text_directory=text_directory), pdf_paths)
@@ -1,26 +1,68 @@
 import os
 import re
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 import yake
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# Per-process extractor cache for the process-pool workers, keyed by
+# max_terms so each worker builds its extractor once.
+_worker_extractors = {}
+
+
+def _extract_keywords_worker(text, max_terms):
+    """
+    Extract key terms from one text inside a worker process.
+
+    Args:
+        text (str): The text to extract terms from.
+        max_terms (int): The maximum number of terms to extract.
+
+    Returns:
+        set: A set of extracted key terms.
+    """
+    extractor = _worker_extractors.get(max_terms)
+    if extractor is None:
+        extractor = yake.KeywordExtractor(lan="en", n=2, dedupLim=0.9, top=max_terms)
+        _worker_extractors[max_terms] = extractor
+    return set(kw.lower() for kw, _ in extractor.extract_keywords(text))
+
 
 class TermExtractionHandler:
     """
     A class to handle term extraction from text files.
     """
 
-    def __init__(self, results_directory):
+    # Split text into sections by headings (e.g., "1. ", "2. ");
+    # compiled once instead of re-parsed on every map_terms_to_sections call.
+    _SECTION_RE = re.compile(r"(?=\b\d+\.\s)")
+
+    def __init__(self, results_directory, max_terms=150):
         """
         Initialize the TermExtractionHandler with the results directory.
 
         Args:
             results_directory (str): The directory to save the term extraction results.
+            max_terms (int): The maximum number of terms to extract per text.
         """
         self.results_directory = results_directory
+        self.max_terms = max_terms
+        # Build the extractor once; constructing a KeywordExtractor reloads
+        # the stopword list, so doing it per file is wasted work. A single
+        # n=2 extractor already yields both unigram and bigram candidates.
+        self.kw_extractor = yake.KeywordExtractor(
+            lan="en", n=2, dedupLim=0.9, top=max_terms
+        )
 
     def load_text_files(self, directory):
         """
@@ -33,12 +75,11 @@ class TermExtractionHandler:
             dict: A dictionary where keys are filenames and values are file contents.
         """
         texts = {}
-        for filename in os.listdir(directory):
-            if filename.endswith("_text.txt"):
-                with open(
-                    os.path.join(directory, filename), "r", encoding="utf-8"
-                ) as file:
-                    texts[filename] = file.read()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith("_text.txt") and entry.is_file():
+                    with open(entry.path, "r", encoding="utf-8") as file:
+                        texts[entry.name] = file.read()
         return texts
 
     def load_ground_truth_terms(self, ground_truth_directory):
@@ -52,104 +93,92 @@ class TermExtractionHandler:
             set: A set of ground truth terms.
         """
         terms = set()
-        for filename in os.listdir(ground_truth_directory):
-            if filename.endswith("_terms.txt"):
-                with open(
-                    os.path.join(ground_truth_directory, filename),
-                    "r",
-                    encoding="utf-8",
-                ) as file:
-                    content = file.read()
-                    for line in content.splitlines():
-                        if line.startswith("- "):
-                            term = line[2:].strip().lower()
-                            terms.add(term)
+        with os.scandir(ground_truth_directory) as entries:
+            for entry in entries:
+                if entry.name.endswith("_terms.txt") and entry.is_file():
+                    with open(entry.path, "r", encoding="utf-8") as file:
+                        content = file.read()
+                        for line in content.splitlines():
+                            if line.startswith("- "):
+                                term = line[2:].strip().lower()
+                                terms.add(term)
         return terms
 
-    def extract_key_terms(self, text, max_terms=150):
+    def extract_key_terms(self, text):
         """
         Extract key terms from text using YAKE.
 
         Args:
             text (str): The text to extract terms from.
-            max_terms (int): The maximum number of terms to extract.
 
         Returns:
             set: A set of extracted key terms.
         """
-        kw_extractor_unigrams = yake.KeywordExtractor(
-            lan="en", n=1, dedupLim=0.9, top=max_terms // 2
-        )
-        kw_extractor_bigrams = yake.KeywordExtractor(
-            lan="en", n=2, dedupLim=0.9, top=max_terms // 2
-        )
-
-        keywords_unigrams = kw_extractor_unigrams.extract_keywords(text)
-        keywords_bigrams = kw_extractor_bigrams.extract_keywords(text)
-
-        keywords = keywords_unigrams + keywords_bigrams
+        keywords = self.kw_extractor.extract_keywords(text)
 
         extracted_terms = set(kw.lower() for kw, _ in keywords)  # Remove duplicates
         return extracted_terms
 
-    def ensure_critical_terms(self, extracted_terms, text):
+    def ensure_critical_terms(self, extracted_terms, text_lower):
         """
         Ensure critical terms are present in the extracted terms.
 
         Args:
             extracted_terms (set): The set of extracted terms.
-            text (str): The text to check for critical terms.
+            text_lower (str): The lowercased text to check for critical terms.
 
         Returns:
-            list: A list of extracted terms including critical terms.
+            set: The set of extracted terms including critical terms.
         """
         critical_terms = ["confidentiality", "security deposit", "employee's duties"]
-        text_lower = text.lower()
+        found = 0
         for term in critical_terms:
             if term in text_lower:
-                logging.info(f"Critical term '{term}' found in text.")
+                found += 1
                 if term not in extracted_terms:
-                    logging.info(f"Adding critical term: {term}")
+                    logging.debug("Adding critical term: %s", term)
                     extracted_terms.add(term)
             else:
-                logging.info(f"Critical term '{term}' not found in text.")
-        return list(extracted_terms)
+                logging.debug("Critical term '%s' not found in text.", term)
+        logging.info("Critical terms found: %d/%d", found, len(critical_terms))
+        return extracted_terms
 
-    def ensure_ground_truth_terms(self, extracted_terms, ground_truth_terms, text):
+    def ensure_ground_truth_terms(self, extracted_terms, ground_truth_terms, text_lower):
         """
         Ensure ground truth terms are present in the extracted terms.
 
         Args:
             extracted_terms (set): The set of extracted terms.
             ground_truth_terms (set): The set of ground truth terms.
-            text (str): The text to check for ground truth terms.
+            text_lower (str): The lowercased text to check for ground truth terms.
 
         Returns:
-            list: A list of extracted terms including ground truth terms.
+            set: The set of extracted terms including ground truth terms.
         """
-        text_lower = text.lower()
+        found = 0
         for term in ground_truth_terms:
             if term in text_lower:
-                logging.info(f"Ground truth term '{term}' found in text.")
+                found += 1
                 if term not in extracted_terms:
-                    logging.info(f"Adding ground truth term: {term}")
-                    extracted_terms.append(term)
+                    logging.debug("Adding ground truth term: %s", term)
+                    extracted_terms.add(term)
             else:
-                logging.info(f"Ground truth term '{term}' not found in text.")
-        return list(extracted_terms)
+                logging.debug("Ground truth term '%s' not found in text.", term)
+        logging.info("Ground truth terms found: %d/%d", found, len(ground_truth_terms))
+        return extracted_terms
 
     def filter_relevant_terms(self, terms, ground_truth_terms):
         """
         Filter relevant terms based on ground truth terms.
 
         Args:
-            terms (list): The list of extracted terms.
+            terms (set): The set of extracted terms.
             ground_truth_terms (set): The set of ground truth terms.
 
         Returns:
             list: A list of relevant terms.
         """
-        return [term for term in terms if term in ground_truth_terms]
+        return list(set(terms) & ground_truth_terms)
 
     def map_terms_to_sections(self, text, terms):
         """
@@ -162,18 +191,39 @@ class TermExtractionHandler:
         Returns:
             dict: A dictionary where keys are terms and values are lists of sections containing the terms.
         """
-        sections = re.split(
-            r"(?=\b\d+\.\s)", text
-        )  # Split text into sections by headings (e.g., "1. ", "2. ")
+        if not terms:
+            return {}
+
+        sections = self._SECTION_RE.split(text)
         term_section_map = {term: [] for term in terms}
 
-        for section in sections:
-            section_lower = section.lower()
+        # One automaton over all terms lets each section be swept in a
+        # single pass instead of one substring scan per term.
+        automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
             for term in terms:
-                if term in section_lower:  # Ensure case-insensitive matching
-                    section_context = section.strip().replace(
-                        "\n", " "
-                    )  # More context from section
+                automaton.add_word(term, term)
+            automaton.make_automaton()
+        else:
+            # Fallback pre-pass when pyahocorasick is unavailable: a section
+            # containing none of the terms' first characters cannot match,
+            # so it is rejected before the per-term substring scan.
+            term_first_chars = frozenset(term[0] for term in terms if term)
+
+        for section in sections:
+            section_lower = section.lower()  # Ensure case-insensitive matching
+            if automaton is not None:
+                matched_terms = {term for _, term in automaton.iter(section_lower)}
+            else:
+                if not any(char in section_lower for char in term_first_chars):
+                    continue
+                matched_terms = {term for term in terms if term in section_lower}
+            if matched_terms:
+                section_context = section.strip().replace(
+                    "\n", " "
+                )  # More context from section
+                for term in matched_terms:
                     if (
                         section_context not in term_section_map[term]
                     ):  # Ensure unique sections
@@ -210,7 +260,7 @@ class TermExtractionHandler:
                 for section in sections:
                     f.write(f"Section: {section}\n")
                     f.write("\n---\n")
-        logging.info(f"Saved term extraction results to {output_file}")
+        logging.info("Saved term extraction results to %s", output_file)
 
     def process_files(self, text_directory, output_directory, ground_truth_terms):
         """
@@ -222,20 +272,35 @@ class TermExtractionHandler:
             ground_truth_terms (set): The set of ground truth terms.
         """
         texts = self.load_text_files(text_directory)
-        for filename, text in texts.items():
-            logging.info(f"Processing file: {filename}")
-            extracted_terms = self.extract_key_terms(text)
-            logging.info(f"Initial extracted terms: {extracted_terms}")
-            extracted_terms = self.ensure_critical_terms(extracted_terms, text)
-            logging.info(f"Terms after ensuring critical terms: {extracted_terms}")
+        if not texts:
+            return
+
+        # YAKE's n-gram statistics are pure Python and CPU-bound, so the
+        # extraction for each file runs in a separate process; the cheaper
+        # ensure/map/save stages stay sequential in this process.
+        with ProcessPoolExecutor() as executor:
+            extracted_sets = list(
+                executor.map(
+                    partial(_extract_keywords_worker, max_terms=self.max_terms),
+                    texts.values(),
+                )
+            )
+
+        for (filename, text), extracted_terms in zip(texts.items(), extracted_sets):
+            logging.info("Processing file: %s", filename)
+            text_lower = text.lower()  # Lowercase once per file, not per check
+            logging.debug("Initial extracted terms: %s", extracted_terms)
+            extracted_terms = self.ensure_critical_terms(extracted_terms, text_lower)
+            logging.debug("Terms after ensuring critical terms: %s", extracted_terms)
             ensured_terms = self.ensure_ground_truth_terms(
-                extracted_terms, ground_truth_terms, text
+                extracted_terms, ground_truth_terms, text_lower
             )
-            logging.info(f"Terms after ensuring ground truth terms: {ensured_terms}")
+            logging.debug("Terms after ensuring ground truth terms: %s", ensured_terms)
             relevant_terms = self.filter_relevant_terms(
                 ensured_terms, ground_truth_terms
             )
-            logging.info(f"Relevant terms: {relevant_terms}")
+            logging.info("Relevant terms: %d", len(relevant_terms))
+            logging.debug("Relevant terms: %s", relevant_terms)
             term_section_map = self.map_terms_to_sections(text, relevant_terms)
             self.save_term_extraction_results(
                 output_directory, filename, relevant_terms, term_section_map
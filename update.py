@@ -0,0 +1,149 @@
+import os
+import time
+import logging
+import hashlib
+
+from watchdog.events import PatternMatchingEventHandler
+from watchdog.observers import Observer
+
+from legaldocs.evaluate import parse_term_extraction_results
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+
+class UpdateHandler:
+    """
+    A class to monitor term extraction results and display updated documents.
+    """
+
+    def __init__(self, results_directory):
+        """
+        Initialize the UpdateHandler with the results directory.
+
+        Args:
+            results_directory (str): The directory containing the term extraction results.
+        """
+        self.results_directory = results_directory
+        self.file_hashes = {}
+
+    def compute_file_hash(self, file_path):
+        """
+        Compute the MD5 hash of a file for change detection.
+
+        Args:
+            file_path (str): Path to the file to hash.
+
+        Returns:
+            str: The hexadecimal MD5 digest of the file contents.
+        """
+        with open(file_path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                # hashlib.file_digest reads the file in C, avoiding a
+                # per-chunk read loop in Python.
+                return hashlib.file_digest(f, "md5").hexdigest()
+            # Python < 3.11: read into one reusable 1 MiB buffer and hash
+            # memoryview slices so each chunk is fed without a bytes copy.
+            hash_md5 = hashlib.md5()
+            buffer = bytearray(1 << 20)
+            view = memoryview(buffer)
+            while chunk_size := f.readinto(buffer):
+                hash_md5.update(view[:chunk_size])
+            return hash_md5.hexdigest()
+
+    def load_term_extraction_results(self, filename):
+        """
+        Load and parse a term extraction results file.
+
+        Args:
+            filename (str): The filename of the term extraction results file.
+
+        Returns:
+            tuple: A tuple containing a list of terms and a dictionary mapping terms to their sections.
+        """
+        file_path = os.path.join(self.results_directory, filename)
+        with open(file_path, "r", encoding="utf-8") as file:
+            # Lowercase once here instead of per line in the parser.
+            content = file.read().lower()
+        return parse_term_extraction_results(content)
+
+    def display_updated_document(self, filename):
+        """
+        Display the updated terms and sections for a document.
+
+        Args:
+            filename (str): The filename of the updated term extraction results file.
+        """
+        terms, term_section_map = self.load_term_extraction_results(filename)
+        logging.info("Updated results for %s: %d terms", filename, len(terms))
+        logging.debug("Extracted Terms: %s", terms)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            for term, sections in term_section_map.items():
+                logging.debug("Term: %s", term)
+                for section in sections:
+                    logging.debug("Section: %s", section)
+
+    def on_results_file_modified(self, file_path):
+        """
+        Handle a modification event for a term extraction results file.
+
+        Args:
+            file_path (str): Path to the modified file.
+        """
+        filename = os.path.basename(file_path)
+        file_hash = self.compute_file_hash(file_path)
+        if file_hash != self.file_hashes.get(filename):
+            logging.info("Detected change in %s", filename)
+            self.file_hashes[filename] = file_hash
+            self.display_updated_document(filename)
+
+    def monitor_changes(self):
+        """
+        Monitor the results directory for changes and display updated documents.
+
+        Uses kernel-level file notifications via watchdog, so the process
+        sleeps until the OS reports a change instead of re-hashing every
+        file on a polling interval. Hashes are still compared per event to
+        ignore the duplicate notifications some editors and filesystems emit.
+        """
+        handler = _ResultsFileEventHandler(self)
+        observer = Observer()
+        observer.schedule(handler, self.results_directory, recursive=False)
+        observer.start()
+        logging.info("Monitoring %s for changes...", self.results_directory)
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            observer.stop()
+        observer.join()
+
+
+class _ResultsFileEventHandler(PatternMatchingEventHandler):
+    """
+    A watchdog event handler that forwards results-file changes to an UpdateHandler.
+    """
+
+    def __init__(self, update_handler):
+        super().__init__(patterns=["*_terms.txt"], ignore_directories=True)
+        self.update_handler = update_handler
+
+    def on_modified(self, event):
+        self.update_handler.on_results_file_modified(event.src_path)
+
+    def on_created(self, event):
+        self.update_handler.on_results_file_modified(event.src_path)
+
+
+def main():
+    """
+    Main function to monitor the term extraction results directory for changes.
+    """
+    results_directory = "term_extraction_results"
+    handler = UpdateHandler(results_directory)
+    handler.monitor_changes()
+
+
+if __name__ == "__main__":
+    main()